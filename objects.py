@@ -47,6 +47,9 @@ class TimeUnit(Enum):
     DAY = 'd'
     WEEK = 'w'
 
+# get_history_kline 支持的分钟级 ktype 周期
+_SUPPORTED_KTYPE_MINUTES = frozenset({1, 3, 5, 15, 30, 60})
+
 @dataclass
 class TimeFrame:
     amount: int
@@ -62,16 +65,14 @@ class TimeFrame:
         返回值示例：K_1M、K_5M、K_60M、K_DAY、K_WEEK。
         若 unit/amount 组合不被当前 SDK 支持，则返回空字符串。
         """
-        supported_minute_amounts = {1, 3, 5, 15, 30, 60}
-
         if self.unit == TimeUnit.MINUTE:
-            if self.amount in supported_minute_amounts:
+            if self.amount in _SUPPORTED_KTYPE_MINUTES:
                 return f"K_{self.amount}M"
             return ""
 
         if self.unit == TimeUnit.HOUR:
             minutes = self.amount * 60
-            if minutes in supported_minute_amounts:
+            if minutes in _SUPPORTED_KTYPE_MINUTES:
                 return f"K_{minutes}M"
             return ""
 